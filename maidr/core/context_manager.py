@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import builtins
 import contextlib
 import contextvars
 import threading
@@ -80,6 +81,8 @@ class HighlightContextManager:
     elements = {}
     elements_to_highlight = []
     selector_ids = []
+    # id(element) -> selector id, so per-artist draws avoid list scans.
+    _selector_by_element = {}
 
     def __new__(cls):
         if not cls._instance:
@@ -99,14 +102,13 @@ class HighlightContextManager:
     @classmethod
     @contextlib.contextmanager
     def set_maidr_element(cls, element, id):
-        if element not in cls.elements_to_highlight:
+        selector_id = cls._selector_by_element.get(builtins.id(element))
+        if selector_id is None:
             yield
             return
 
         try:
-            cls.elements[id] = cls.selector_ids[
-                cls.elements_to_highlight.index(element)
-            ]
+            cls.elements[id] = selector_id
             yield
         finally:
             del cls.elements[id]
@@ -116,7 +118,14 @@ class HighlightContextManager:
     def set_maidr_elements(cls, elements: list, selector_ids: list):
         cls.elements_to_highlight = elements
         cls.selector_ids = selector_ids
+        # Insert in reverse so an element listed twice maps to its first
+        # selector id, as a list lookup would.
+        cls._selector_by_element = {
+            builtins.id(element): selector_id
+            for element, selector_id in reversed(list(zip(elements, selector_ids)))
+        }
         try:
             yield
         finally:
             cls.elements_to_highlight.clear()
+            cls._selector_by_element = {}
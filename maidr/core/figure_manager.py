@@ -82,11 +82,12 @@ class FigureManager:
             ax = axes[0]
         else:
             ax = axes
-        if ax.get_figure() is None:
+        fig = ax.get_figure()
+        if fig is None:
             raise ValueError(f"No figure found for axis: {ax}.")
 
         # Add plot to the Maidr object associated with the plot's figure.
-        maidr = cls._get_maidr(ax.get_figure(), plot_type)
+        maidr = cls._get_maidr(fig, plot_type)
         plot = MaidrPlotFactory.create(axes, plot_type, **kwargs)
         maidr.plots.append(plot)
         maidr.selector_ids.append(Maidr._unique_id())
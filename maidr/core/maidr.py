@@ -539,21 +539,21 @@ class Maidr:
             if isinstance(current_schema, dict) and "id" in current_schema:
                 element.attrib["id"] = str(current_schema["id"])  # ensure match
             if embed_data:
-                element.attrib["maidr"] = json.dumps(current_schema, indent=2)
+                element.attrib["maidr"] = json.dumps(
+                    current_schema, separators=(",", ":")
+                )
             root_svg = element
             break
 
-        svg_buffer = io.StringIO()  # Reset the buffer
-        svg_buffer.write(
+        # The SVG is consumed by the browser, so serialise it as-is rather
+        # than re-indenting the whole document.
+        return HTML(
             etree.tostring(
                 root_svg,
-                pretty_print=True,
                 encoding="unicode",  # type: ignore
             )
         )
 
-        return HTML(svg_buffer.getvalue())
-
     def _set_maidr_id(self, maidr_id: str) -> None:
         """Set a unique identifier to each ``MaidrPlot``."""
         self.maidr_id = maidr_id
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Union, Dict
 from matplotlib.axes import Axes
+import numpy as np
 import pandas as pd
 
 from maidr.core.enum import PlotType
@@ -91,6 +92,63 @@ class CandlestickPlot(MaidrPlot):
         """
         Extract candlestick data directly from DataFrame without any formatting.
 
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame with OHLC data and DatetimeIndex.
+
+        Returns
+        -------
+        list[dict]
+            List of candlestick data dictionaries with raw values.
+        """
+        columns = ["Open", "High", "Low", "Close"]
+        has_volume = "Volume" in df.columns
+        if has_volume:
+            columns.append("Volume")
+
+        # Fast path: plain NumPy numeric, uniquely named columns convert to
+        # float in one call and every row is kept. Anything else, including
+        # pandas nullable dtypes that may hold pd.NA, goes row by row so that
+        # rows with unconvertible values are skipped as before.
+        if not (
+            df.columns.is_unique
+            and all(
+                col in df.columns
+                and isinstance(df[col].dtype, np.dtype)
+                and df[col].dtype.kind in "biuf"
+                for col in columns
+            )
+        ):
+            return self._extract_rows(df)
+
+        values = df[columns].to_numpy(dtype=float)
+        if not has_volume:
+            values = np.column_stack((values, np.zeros(len(df))))
+
+        return [
+            {
+                "value": str(date_value),
+                "open": open_price,
+                "high": high_price,
+                "low": low_price,
+                "close": close_price,
+                "volume": volume,
+            }
+            for date_value, (
+                open_price,
+                high_price,
+                low_price,
+                close_price,
+                volume,
+            ) in zip(df.index, values.tolist())
+        ]
+
+    @staticmethod
+    def _extract_rows(df: pd.DataFrame) -> list[dict]:
+        """
+        Extract candlestick data row by row, skipping malformed rows.
+
         Parameters
         ----------
         df : pd.DataFrame
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import Any
 
 from matplotlib.axes import Axes
@@ -11,6 +10,19 @@ from maidr.core.enum.maidr_key import MaidrKey
 from maidr.core.enum.plot_type import PlotType
 from maidr.core.plot.maidr_plot import MaidrPlot
 from maidr.core.plot.violinplot import ViolinBoxStatsCalculator
+from maidr.util.svg_utils import new_maidr_gids
+
+# Schema keys resolved once; they are used for every violin on render.
+_K_Z = MaidrKey.Z.value
+_K_MIN = MaidrKey.MIN.value
+_K_Q1 = MaidrKey.Q1.value
+_K_Q2 = MaidrKey.Q2.value
+_K_Q3 = MaidrKey.Q3.value
+_K_MAX = MaidrKey.MAX.value
+_K_MEAN = MaidrKey.MEAN.value
+_K_IQ = MaidrKey.IQ.value
+_K_LO = MaidrKey.LOWER_OUTLIER.value
+_K_HI = MaidrKey.UPPER_OUTLIER.value
 
 
 class ViolinBoxPlot(MaidrPlot):
@@ -112,38 +124,33 @@ class ViolinBoxPlot(MaidrPlot):
         # Tag artists and register elements for SVG highlighting.
         self._tag_artists()
 
-        groups = self._resolve_groups()
-        box_data: list[dict] = []
+        groups = self._resolve_groups()[: len(self._values)]
+        stats_list = ViolinBoxStatsCalculator.compute_batch(
+            self._values[: len(groups)], full_range=self._use_full_range
+        )
 
-        for group, vals in zip(groups, self._values):
-            if self._use_full_range:
-                stats = ViolinBoxStatsCalculator.compute_full_range(vals)
-            else:
-                stats = ViolinBoxStatsCalculator.compute(vals)
+        # Include mean only when requested.
+        show_mean = bool(
+            self._violin_options and self._violin_options.get("showMean", False)
+        )
 
+        box_data: list[dict] = []
+        for group, stats in zip(groups, stats_list):
             record: dict = {
-                MaidrKey.Z.value: str(group),
-                MaidrKey.LOWER_OUTLIER.value: stats[MaidrKey.LOWER_OUTLIER.value],
-                MaidrKey.MIN.value: round(stats[MaidrKey.MIN.value], 4),
-                MaidrKey.Q1.value: round(stats[MaidrKey.Q1.value], 4),
-                MaidrKey.Q2.value: round(stats[MaidrKey.Q2.value], 4),
-                MaidrKey.Q3.value: round(stats[MaidrKey.Q3.value], 4),
-                MaidrKey.MAX.value: round(stats[MaidrKey.MAX.value], 4),
-                MaidrKey.UPPER_OUTLIER.value: stats[MaidrKey.UPPER_OUTLIER.value],
+                _K_Z: str(group),
+                _K_LO: stats[_K_LO],
+                _K_MIN: round(stats[_K_MIN], 4),
+                _K_Q1: round(stats[_K_Q1], 4),
+                _K_Q2: round(stats[_K_Q2], 4),
+                _K_Q3: round(stats[_K_Q3], 4),
+                _K_MAX: round(stats[_K_MAX], 4),
+                _K_HI: stats[_K_HI],
             }
-
-            # Include mean only when requested.
-            show_mean = (
-                self._violin_options.get("showMean", False)
-                if self._violin_options
-                else False
-            )
-            if show_mean and MaidrKey.MEAN.value in stats:
-                record[MaidrKey.MEAN.value] = round(stats[MaidrKey.MEAN.value], 4)
-
+            if show_mean:
+                record[_K_MEAN] = round(stats[_K_MEAN], 4)
             box_data.append(record)
 
-        return box_data if self._orientation == "vert" else list(reversed(box_data))
+        return box_data if self._orientation == "vert" else box_data[::-1]
 
     # ------------------------------------------------------------------
     # Artist tagging
@@ -157,23 +164,34 @@ class ViolinBoxPlot(MaidrPlot):
 
     def _tag_mpl_artists(self) -> None:
         """Tag matplotlib LineCollection artists with GIDs."""
-        for key, artist in self._mpl_artists.items():
-            gid = f"maidr-{uuid.uuid4()}"
+        gids = new_maidr_gids(len(self._mpl_artists))
+        for (key, artist), gid in zip(self._mpl_artists.items(), gids):
             artist.set_gid(gid)
             self._mpl_gids[key] = gid
-            self._elements.append(artist)
+        self._elements.extend(self._mpl_artists.values())
 
     def _tag_sns_artists(self) -> None:
         """Tag seaborn inner-box Line2D artists with GIDs."""
+        tagged: list = []
+        gids = iter(
+            new_maidr_gids(
+                sum(
+                    line is not None
+                    for violin_lines in self._sns_box_lines
+                    for line in violin_lines.values()
+                )
+            )
+        )
         for violin_lines in self._sns_box_lines:
             gid_map: dict[str, str] = {}
             for role, line in violin_lines.items():
                 if line is not None:
-                    gid = f"maidr-{uuid.uuid4()}"
+                    gid = next(gids)
                     line.set_gid(gid)
                     gid_map[role] = gid
-                    self._elements.append(line)
+                    tagged.append(line)
             self._sns_gids.append(gid_map)
+        self._elements.extend(tagged)
 
     # ------------------------------------------------------------------
     # Selector builders
@@ -186,41 +204,33 @@ class ViolinBoxPlot(MaidrPlot):
         with one ``<path>`` per violin segment.  Use ``:nth-child(i)`` to
         select the *i*-th violin's element.
         """
-        cmins_gid = self._mpl_gids.get("cmins", "")
-        cmaxes_gid = self._mpl_gids.get("cmaxes", "")
-        cbars_gid = self._mpl_gids.get("cbars", "")
-        cmedians_gid = self._mpl_gids.get("cmedians", "")
+        # Resolve each key's selector prefix once; only the ``nth-child``
+        # index varies between violins. cbars is the vertical whisker bar
+        # (min→max), not the IQ range — matplotlib violinplot has no
+        # IQ-range visual element.
+        templates: list[tuple[str, str]] = []
+        for schema_key, artist_key in (
+            (_K_MIN, "cmins"),
+            (_K_IQ, "cbars"),
+            (_K_Q2, "cmedians"),
+            (_K_MAX, "cmaxes"),
+        ):
+            gid = self._mpl_gids.get(artist_key, "")
+            templates.append(
+                (schema_key, f"g[id='{gid}'] > path:nth-child(" if gid else "")
+            )
         cmeans_gid = self._mpl_gids.get("cmeans", "")
+        mean_prefix = f"g[id='{cmeans_gid}'] > path:nth-child(" if cmeans_gid else ""
 
         selectors: list[dict] = []
         for i in range(num_violins):
-            nth = i + 1  # CSS nth-child is 1-indexed
-            sel: dict[str, Any] = {
-                MaidrKey.LOWER_OUTLIER.value: [],
-                MaidrKey.MIN.value: (
-                    f"g[id='{cmins_gid}'] > path:nth-child({nth})" if cmins_gid else ""
-                ),
-                # cbars is the vertical whisker bar (min→max), not the IQ range.
-                # Matplotlib violinplot has no IQ-range visual element.
-                MaidrKey.IQ.value: (
-                    f"g[id='{cbars_gid}'] > path:nth-child({nth})" if cbars_gid else ""
-                ),
-                MaidrKey.Q2.value: (
-                    f"g[id='{cmedians_gid}'] > path:nth-child({nth})"
-                    if cmedians_gid
-                    else ""
-                ),
-                MaidrKey.MAX.value: (
-                    f"g[id='{cmaxes_gid}'] > path:nth-child({nth})"
-                    if cmaxes_gid
-                    else ""
-                ),
-                MaidrKey.UPPER_OUTLIER.value: [],
-            }
-            if cmeans_gid:
-                sel[MaidrKey.MEAN.value] = (
-                    f"g[id='{cmeans_gid}'] > path:nth-child({nth})"
-                )
+            nth = f"{i + 1})"  # CSS nth-child is 1-indexed
+            sel: dict[str, Any] = {_K_LO: []}
+            for schema_key, prefix in templates:
+                sel[schema_key] = prefix + nth if prefix else ""
+            sel[_K_HI] = []
+            if mean_prefix:
+                sel[_K_MEAN] = mean_prefix + nth
             selectors.append(sel)
 
         return selectors
@@ -238,18 +248,12 @@ class ViolinBoxPlot(MaidrPlot):
             median_gid = gid_map.get("median", "")
 
             sel: dict[str, Any] = {
-                MaidrKey.LOWER_OUTLIER.value: [],
-                MaidrKey.MIN.value: (
-                    f"g[id='{whisker_gid}'] > path" if whisker_gid else ""
-                ),
-                MaidrKey.IQ.value: (f"g[id='{iq_gid}'] > path" if iq_gid else ""),
-                MaidrKey.Q2.value: (
-                    f"g[id='{median_gid}'] > path" if median_gid else ""
-                ),
-                MaidrKey.MAX.value: (
-                    f"g[id='{whisker_gid}'] > path" if whisker_gid else ""
-                ),
-                MaidrKey.UPPER_OUTLIER.value: [],
+                _K_LO: [],
+                _K_MIN: (f"g[id='{whisker_gid}'] > path" if whisker_gid else ""),
+                _K_IQ: (f"g[id='{iq_gid}'] > path" if iq_gid else ""),
+                _K_Q2: (f"g[id='{median_gid}'] > path" if median_gid else ""),
+                _K_MAX: (f"g[id='{whisker_gid}'] > path" if whisker_gid else ""),
+                _K_HI: [],
             }
             selectors.append(sel)
 
@@ -258,12 +262,12 @@ class ViolinBoxPlot(MaidrPlot):
     @staticmethod
     def _empty_selector() -> dict:
         return {
-            MaidrKey.LOWER_OUTLIER.value: [],
-            MaidrKey.MIN.value: "",
-            MaidrKey.IQ.value: "",
-            MaidrKey.Q2.value: "",
-            MaidrKey.MAX.value: "",
-            MaidrKey.UPPER_OUTLIER.value: [],
+            _K_LO: [],
+            _K_MIN: "",
+            _K_IQ: "",
+            _K_Q2: "",
+            _K_MAX: "",
+            _K_HI: [],
         }
 
     # ------------------------------------------------------------------
@@ -18,6 +18,10 @@ from maidr.util.svg_utils import data_to_svg_coords
 #: Default maximum number of output points per violin KDE curve.
 _DEFAULT_MAX_KDE_POINTS = 30
 
+#: Y-levels kept per violin. Each level produces 2 output points (left +
+#: right), so this is half the desired point count.
+_TARGET_KDE_LEVELS = max(_DEFAULT_MAX_KDE_POINTS // 2, 3)
+
 
 class ViolinKdePlot(MaidrPlot):
     """
@@ -54,8 +58,7 @@ class ViolinKdePlot(MaidrPlot):
         self._orientation = kwargs.get("orientation", "vert")
 
         # Register PolyCollections so highlight.py tags them in SVG.
-        for poly in self._poly_collections:
-            self._elements.append(poly)
+        self._elements.extend(self._poly_collections)
 
     # ------------------------------------------------------------------
     # Selector
@@ -83,10 +86,22 @@ class ViolinKdePlot(MaidrPlot):
 
         is_horz = self._orientation == "horz"
 
-        for idx, kde_line in enumerate(self._kde_lines):
-            self._elements.append(kde_line)
-            xydata = np.asarray(kde_line.get_xydata())
+        self._elements.extend(self._kde_lines)
+        outlines = [line.get_xydata() for line in self._kde_lines]
+
+        # Centre of every outline on the density axis (col 1 for horizontal,
+        # col 0 for vertical) from one segmented reduction over all vertices.
+        centers = np.full(len(outlines), np.nan)
+        lengths = np.fromiter((len(xy) for xy in outlines), dtype=np.intp)
+        filled = lengths > 0
+        if filled.any():
+            density = np.concatenate(
+                [xy[:, 1 if is_horz else 0] for xy in outlines if len(xy)]
+            )
+            starts = (np.cumsum(lengths) - lengths)[filled]
+            centers[filled] = np.add.reduceat(density, starts) / lengths[filled]
 
+        for idx, xydata in enumerate(outlines):
             if is_horz:
                 # Horizontal violin: col 0 = value axis, col 1 = density axis.
                 # Swap so that internal variables match vertical convention:
@@ -101,7 +116,7 @@ class ViolinKdePlot(MaidrPlot):
             x_label = x_levels[idx] if x_levels and idx < len(x_levels) else None
 
             violin_points = self._interpolate_violin(
-                x_data, y_data, x_svg, y_svg, x_label, is_horz
+                x_data, y_data, x_svg, y_svg, x_label, is_horz, centers[idx]
             )
             all_violins.append(violin_points)
 
@@ -141,18 +156,21 @@ class ViolinKdePlot(MaidrPlot):
         # Strategy 1 — current tick labels on the axes.
         try:
             raw = [lbl.get_text() for lbl in tick_getter()]
+        except Exception:
+            raw = None
+        else:
             labels = [label for label in raw if label.strip()]
             if labels:
                 return labels
-        except Exception:
-            pass
 
-        # Strategy 2 — LevelExtractorMixin.
-        levels = LevelExtractorMixin.extract_level(self.ax, maidr_key)
-        if levels:
-            filtered = [level for level in levels if str(level).strip()]
-            if filtered:
-                return filtered
+        # Strategy 2 — LevelExtractorMixin. It filters the same tick labels,
+        # so it can only add anything when reading them above failed.
+        if raw is None:
+            levels = LevelExtractorMixin.extract_level(self.ax, maidr_key)
+            if levels:
+                filtered = [level for level in levels if str(level).strip()]
+                if filtered:
+                    return filtered
 
         # Strategy 3 — patch-time fallback.
         return self._x_levels
@@ -165,10 +183,14 @@ class ViolinKdePlot(MaidrPlot):
         y_svg: np.ndarray,
         x_label: str | None,
         is_horz: bool = False,
+        x_center: float | None = None,
     ) -> list[dict]:
         """
         Interpolate left/right sides of a single violin to a common Y
         grid and return paired ``ViolinKdePoint`` dicts.
+
+        *x_center* splits the outline into left/right sides; it defaults to
+        the mean of *x_data*.
         """
         y_unique = sorted(set(y_data))
         if len(y_unique) < 2:
@@ -177,13 +199,17 @@ class ViolinKdePlot(MaidrPlot):
         y_min, y_max = min(y_unique), max(y_unique)
         y_common = np.linspace(y_min, y_max, len(y_unique))
 
-        x_center = np.mean(x_data)
-        left = [(x, y) for x, y in zip(x_data, y_data) if x <= x_center]
-        right = [(x, y) for x, y in zip(x_data, y_data) if x >= x_center]
+        if x_center is None:
+            x_center = np.mean(x_data)
+        left_mask = x_data <= x_center
+        right_mask = x_data >= x_center
 
-        if not left or not right:
+        if not left_mask.any() or not right_mask.any():
             return self._fallback_points(x_data, y_data, x_svg, y_svg, x_label)
 
+        left = (x_data[left_mask], y_data[left_mask])
+        right = (x_data[right_mask], y_data[right_mask])
+
         try:
             return self._interpolated_points(left, right, y_common, x_label, is_horz)
         except (ValueError, np.linalg.LinAlgError):
@@ -191,17 +217,14 @@ class ViolinKdePlot(MaidrPlot):
 
     def _interpolated_points(
         self,
-        left: list[tuple[float, float]],
-        right: list[tuple[float, float]],
+        left: tuple[np.ndarray, np.ndarray],
+        right: tuple[np.ndarray, np.ndarray],
         y_common: np.ndarray,
         x_label: str | None,
         is_horz: bool = False,
     ) -> list[dict]:
-        left_x, left_y = np.array([p[0] for p in left]), np.array([p[1] for p in left])
-        right_x, right_y = (
-            np.array([p[0] for p in right]),
-            np.array([p[1] for p in right]),
-        )
+        left_x, left_y = left
+        right_x, right_y = right
 
         li = np.argsort(left_y)
         ri = np.argsort(right_y)
@@ -224,88 +247,65 @@ class ViolinKdePlot(MaidrPlot):
         )
 
         # --- Evaluate on full grid, then simplify with RDP ---------------
-        y_vals: list[float] = []
-        xl_vals: list[float] = []
-        xr_vals: list[float] = []
-        widths: list[float] = []
-
-        for y_val in y_common:
-            xl = float(f_left(y_val))
-            xr = float(f_right(y_val))
-            if np.isnan(xl) or np.isnan(xr) or np.isnan(y_val):
-                continue
-            width = abs(xr - xl)
-            if np.isnan(width) or width <= 0:
-                continue
-            y_vals.append(float(y_val))
-            xl_vals.append(xl)
-            xr_vals.append(xr)
-            widths.append(width)
-
-        if not y_vals:
+        # Both interpolants take the whole grid at once; invalid levels are
+        # dropped with a single mask.
+        xl_all = f_left(y_common)
+        xr_all = f_right(y_common)
+        w_all = np.abs(xr_all - xl_all)
+        # NaN widths fail ``> 0``, so this also drops NaN xl/xr.
+        keep = ~np.isnan(y_common) & (w_all > 0)
+        if not keep.any():
             return []
 
-        # Each Y-level produces 2 output points (left + right), so the
-        # target number of Y-levels is half the desired point count.
-        target_levels = max(_DEFAULT_MAX_KDE_POINTS // 2, 3)
+        y_arr = y_common[keep]
+        xl_arr = xl_all[keep]
+        xr_arr = xr_all[keep]
+        w_arr = w_all[keep]
 
-        y_arr = np.array(y_vals)
-        w_arr = np.array(widths)
-
-        if len(y_arr) > target_levels:
+        if len(y_arr) > _TARGET_KDE_LEVELS:
             # Build a (y, width) curve and apply RDP to find the Y-levels
             # that best preserve the violin shape.
             shape_curve = np.column_stack([y_arr, w_arr])
-            mask = simplify_curve(shape_curve, target=target_levels)
+            mask = simplify_curve(shape_curve, target=_TARGET_KDE_LEVELS)
             indices = np.where(mask)[0]
         else:
             indices = np.arange(len(y_arr))
 
         # --- Build output points for retained Y-levels -------------------
-        points: list[dict] = []
-        for i in indices:
-            y_val = y_vals[i]
-            xl = xl_vals[i]
-            xr = xr_vals[i]
-            width = widths[i]
-
-            if is_horz:
-                # Horizontal: xl/xr are density-axis (y in mpl), y_val is
-                # value-axis (x in mpl).
-                sx_l, sy_l = data_to_svg_coords(
-                    self.ax, np.array([y_val]), np.array([xl])
-                )
-                sx_r, sy_r = data_to_svg_coords(
-                    self.ax, np.array([y_val]), np.array([xr])
-                )
-            else:
-                sx_l, sy_l = data_to_svg_coords(
-                    self.ax, np.array([xl]), np.array([y_val])
-                )
-                sx_r, sy_r = data_to_svg_coords(
-                    self.ax, np.array([xr]), np.array([y_val])
-                )
+        y_sel = y_arr[indices]
+        xl_sel = xl_arr[indices]
+        xr_sel = xr_arr[indices]
+
+        # Resolve orientation once and convert both sides in a single
+        # transform, so left and right share one layout pass.
+        n_sel = len(y_sel)
+        y_both = np.concatenate([y_sel, y_sel])
+        x_both = np.concatenate([xl_sel, xr_sel])
+        if is_horz:
+            # Horizontal: xl/xr are density-axis (y in mpl), y_val is
+            # value-axis (x in mpl).
+            sx, sy = data_to_svg_coords(self.ax, y_both, x_both)
+        else:
+            sx, sy = data_to_svg_coords(self.ax, x_both, y_both)
+        sx_l, sx_r = sx[:n_sel], sx[n_sel:]
+        sy_l, sy_r = sy[:n_sel], sy[n_sel:]
 
+        points: list[dict] = []
+        for y_val, xl, width, l_x, l_y, r_x, r_y in zip(
+            y_sel.tolist(),
+            xl_sel.tolist(),
+            w_arr[indices].tolist(),
+            sx_l.tolist(),
+            sy_l.tolist(),
+            sx_r.tolist(),
+            sy_r.tolist(),
+        ):
             base: dict = {
                 MaidrKey.X: x_label if x_label else xl,
-                MaidrKey.Y: float(y_val),
+                MaidrKey.Y: y_val,
             }
-            points.append(
-                {
-                    **base,
-                    "width": float(width),
-                    "svg_x": float(sx_l[0]),
-                    "svg_y": float(sy_l[0]),
-                }
-            )
-            points.append(
-                {
-                    **base,
-                    "width": float(width),
-                    "svg_x": float(sx_r[0]),
-                    "svg_y": float(sy_r[0]),
-                }
-            )
+            points.append({**base, "width": width, "svg_x": l_x, "svg_y": l_y})
+            points.append({**base, "width": width, "svg_x": r_x, "svg_y": r_y})
 
         return points
 
@@ -18,6 +18,20 @@ from matplotlib.patches import PathPatch, Rectangle
 
 from maidr.core.enum import MaidrKey
 
+# Box-stat schema keys resolved once; these sit on the per-group hot path.
+_K_MIN = MaidrKey.MIN.value
+_K_Q1 = MaidrKey.Q1.value
+_K_Q2 = MaidrKey.Q2.value
+_K_Q3 = MaidrKey.Q3.value
+_K_MAX = MaidrKey.MAX.value
+_K_MEAN = MaidrKey.MEAN.value
+_K_LO = MaidrKey.LOWER_OUTLIER.value
+_K_HI = MaidrKey.UPPER_OUTLIER.value
+
+# Seaborn ``orient`` values that mean horizontal violins; shared with the
+# patch layer so both sides classify orientation the same way.
+HORIZONTAL_ORIENTS = frozenset({"h", "horizontal", "y"})
+
 
 class ViolinDataExtractor:
     """
@@ -57,68 +71,119 @@ class ViolinDataExtractor:
         hue = kwargs.get("hue", None)
         orient = kwargs.get("orient", None)
 
+        # Classify the arguments once; the cases below only combine flags.
+        is_frame = isinstance(df, pd.DataFrame)
+        x_is_col = isinstance(x, str)
+        y_is_col = isinstance(y, str)
+
         # For horizontal orientation the roles of x and y are swapped:
         # x holds the numeric values and y holds the categorical groups.
-        is_horizontal = orient in ("h", "horizontal", "y")
-        if is_horizontal and isinstance(x, str) and isinstance(y, str):
+        is_horizontal = orient in HORIZONTAL_ORIENTS
+        if is_horizontal and x_is_col and y_is_col:
             cat_col, val_col = y, x
         else:
             cat_col, val_col = x, y
+        val_is_col = isinstance(val_col, str)
 
         # Case 1 — DataFrame with categorical & value columns
-        if (
-            isinstance(df, pd.DataFrame)
-            and isinstance(cat_col, str)
-            and isinstance(val_col, str)
-        ):
+        if is_frame and val_is_col and isinstance(cat_col, str):
             groups: list[str] = []
             values: list[np.ndarray] = []
 
             x_order = kwargs.get("order", None)
             hue_order = kwargs.get("hue_order", None) if hue else None
 
+            # Resolve the value column and its null mask once; every group
+            # below is a boolean slice of the same array.
+            y_all, y_valid = ViolinDataExtractor._column_values(df[val_col])
+
             if hue is None:
+                codes = None
                 if x_order is not None:
+                    codes = ViolinDataExtractor._order_codes(df[cat_col], x_order)
+                if codes is not None:
+                    groups, values = ViolinDataExtractor._split_present(
+                        y_all, y_valid, codes, [str(g) for g in x_order]
+                    )
+                elif x_order is not None:
                     for g in x_order:
-                        gdf = df[df[cat_col] == g]
-                        if not gdf.empty:
+                        in_group = (df[cat_col] == g).to_numpy()
+                        if in_group.any():
                             groups.append(str(g))
-                            values.append(gdf[val_col].dropna().values)
+                            values.append(y_all[in_group & y_valid])
                 else:
-                    for g, gdf in df.groupby(cat_col, observed=False):
-                        groups.append(str(g))
-                        values.append(gdf[val_col].dropna().values)
+                    codes, levels = ViolinDataExtractor._group_codes(df[cat_col])
+                    groups = [str(g) for g in levels]
+                    values = ViolinDataExtractor._split_by_codes(
+                        y_all, y_valid, codes, len(levels)
+                    )
             else:
                 # When hue is the same column as the category, avoid
                 # duplicated labels like "Fair_Fair".
-                hue_is_cat = (hue == cat_col)
+                hue_is_cat = hue == cat_col
 
                 if x_order is not None or hue_order is not None:
-                    x_cats = (
-                        x_order if x_order is not None else df[cat_col].unique()
-                    )
-                    h_cats = (
-                        hue_order if hue_order is not None else df[hue].unique()
-                    )
+                    x_cats = x_order if x_order is not None else df[cat_col].unique()
+                    h_cats = hue_order if hue_order is not None else df[hue].unique()
+                    x_codes = ViolinDataExtractor._order_codes(df[cat_col], x_cats)
+                    h_codes = ViolinDataExtractor._order_codes(df[hue], h_cats)
+                    if x_codes is not None and h_codes is not None:
+                        # One pass over the frame: combine both positions
+                        # into an x-major code, matching the loop order below.
+                        n_hue = len(h_cats)
+                        keyed = (x_codes >= 0) & (h_codes >= 0)
+                        codes = np.where(keyed, x_codes * n_hue + h_codes, -1)
+                        labels = [
+                            str(gx) if hue_is_cat else f"{gx}_{gh}"
+                            for gx in x_cats
+                            for gh in h_cats
+                        ]
+                        groups, values = ViolinDataExtractor._split_present(
+                            y_all, y_valid, codes, labels
+                        )
+                        return groups, values
+
+                    h_masks = [(df[hue] == gh).to_numpy() for gh in h_cats]
                     for gx in x_cats:
-                        for gh in h_cats:
-                            gdf = df[(df[cat_col] == gx) & (df[hue] == gh)]
-                            if not gdf.empty:
+                        x_mask = (df[cat_col] == gx).to_numpy()
+                        for gh, h_mask in zip(h_cats, h_masks):
+                            in_group = x_mask & h_mask
+                            if in_group.any():
                                 label = str(gx) if hue_is_cat else f"{gx}_{gh}"
                                 groups.append(label)
-                                values.append(gdf[val_col].dropna().values)
+                                values.append(y_all[in_group & y_valid])
                 else:
-                    for (gx, gh), gdf in df.groupby(
-                        [cat_col, hue], observed=False
-                    ):
-                        label = str(gx) if hue_is_cat else f"{gx}_{gh}"
-                        groups.append(label)
-                        values.append(gdf[val_col].dropna().values)
+                    x_codes, x_levels = ViolinDataExtractor._group_codes(df[cat_col])
+                    h_codes, h_levels = ViolinDataExtractor._group_codes(df[hue])
+                    n_hue = len(h_levels)
+                    keyed = (x_codes >= 0) & (h_codes >= 0)
+                    codes = np.where(keyed, x_codes * n_hue + h_codes, -1)
+
+                    # Like groupby(observed=False), categorical keys yield
+                    # every level combination; otherwise only observed ones.
+                    any_categorical = any(
+                        isinstance(df[col].dtype, pd.CategoricalDtype)
+                        for col in (cat_col, hue)
+                    )
+                    if any_categorical:
+                        combos = np.arange(len(x_levels) * n_hue)
+                    else:
+                        combos = np.unique(codes[keyed])
+                        codes = np.where(keyed, np.searchsorted(combos, codes), -1)
+
+                    for combo in combos:
+                        gx = x_levels[combo // n_hue]
+                        gh = h_levels[combo % n_hue]
+                        groups.append(str(gx) if hue_is_cat else f"{gx}_{gh}")
+                    values = ViolinDataExtractor._split_by_codes(
+                        y_all, y_valid, codes, len(combos)
+                    )
             return groups, values
 
         # Case 2 — DataFrame, only value column → single violin
-        if isinstance(df, pd.DataFrame) and isinstance(val_col, str):
-            return ["Violin"], [df[val_col].dropna().values]
+        if is_frame and val_is_col:
+            y_all, y_valid = ViolinDataExtractor._column_values(df[val_col])
+            return ["Violin"], [y_all[y_valid]]
 
         # Case 3 — list/array as positional arg
         if len(args) > 0:
@@ -127,37 +192,119 @@ class ViolinDataExtractor:
                 if len(data) > 0 and isinstance(data[0], (list, tuple, np.ndarray)):
                     return (
                         [f"Group {i + 1}" for i in range(len(data))],
-                        [np.asarray(d).flatten() for d in data],
+                        [ViolinDataExtractor._as_values(d) for d in data],
                     )
-                return ["Violin"], [np.asarray(data).flatten()]
+                return ["Violin"], [ViolinDataExtractor._as_values(data)]
 
         # Case 4 — data= (non-DataFrame)
-        if "data" in kwargs and not isinstance(kwargs["data"], pd.DataFrame):
-            data = kwargs["data"]
-            if isinstance(data, (list, tuple)):
-                return (
-                    [f"Group {i + 1}" for i in range(len(data))],
-                    [np.asarray(d).flatten() for d in data],
-                )
+        if isinstance(df, (list, tuple)):
+            return (
+                [f"Group {i + 1}" for i in range(len(df))],
+                [ViolinDataExtractor._as_values(d) for d in df],
+            )
 
         # Case 5 — y=array
-        if (
-            y is not None
-            and not isinstance(y, str)
-            and isinstance(y, (list, tuple, np.ndarray))
-        ):
-            return ["Violin"], [np.asarray(y).flatten()]
+        if isinstance(y, (list, tuple, np.ndarray)):
+            return ["Violin"], [ViolinDataExtractor._as_values(y)]
 
         # Case 6 — x=array
-        if (
-            x is not None
-            and not isinstance(x, str)
-            and isinstance(x, (list, tuple, np.ndarray))
-        ):
-            return ["Violin"], [np.asarray(x).flatten()]
+        if isinstance(x, (list, tuple, np.ndarray)):
+            return ["Violin"], [ViolinDataExtractor._as_values(x)]
 
         return [], []
 
+    @staticmethod
+    def _column_values(column: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return *column* as a contiguous float64 array plus its non-null mask.
+
+        Non-numeric columns are returned unconverted.
+        """
+        try:
+            y_all = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            return column.to_numpy(), column.notna().to_numpy()
+        return y_all, ~np.isnan(y_all)
+
+    @staticmethod
+    def _as_values(data: Any) -> np.ndarray:
+        """
+        Return *data* as a 1-D C-contiguous float64 array.
+
+        Copies only when *data* is not already such an array; non-numeric
+        input is flattened unconverted.
+        """
+        try:
+            return np.ascontiguousarray(data, dtype=np.float64).ravel()
+        except (TypeError, ValueError):
+            return np.ravel(data)
+
+    @staticmethod
+    def _group_codes(keys: pd.Series) -> Tuple[np.ndarray, List[Any]]:
+        """
+        Factorize a grouping column the way ``groupby(observed=False)`` does.
+
+        Categorical columns keep every category in category order; other
+        columns use their sorted unique values. Missing keys get code ``-1``.
+        """
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            codes = keys.cat.codes.to_numpy().astype(np.intp)
+            return codes, list(keys.cat.categories)
+        codes, uniques = pd.factorize(keys, sort=True)
+        return codes, list(uniques)
+
+    @staticmethod
+    def _order_codes(keys: pd.Series, order: Any) -> np.ndarray | None:
+        """
+        Map each key to its position in an explicit *order*.
+
+        Missing keys and keys absent from *order* get code ``-1``. Returns
+        ``None`` when *order* cannot serve as a lookup (e.g. duplicates), so
+        the caller can fall back to per-level masks.
+        """
+        try:
+            index = pd.Index(list(order), tupleize_cols=False)
+            if not index.is_unique:
+                return None
+            codes = index.get_indexer(keys).astype(np.intp)
+        except (TypeError, ValueError):
+            return None
+        codes[keys.isna().to_numpy()] = -1
+        return codes
+
+    @staticmethod
+    def _split_present(
+        y_all: np.ndarray, y_valid: np.ndarray, codes: np.ndarray, labels: List[str]
+    ) -> Tuple[List[str], List[np.ndarray]]:
+        """
+        Split by code, keeping only labels that have at least one row.
+
+        A level counts as present even if all of its values are missing.
+        """
+        n_groups = len(labels)
+        present = np.bincount(codes[codes >= 0], minlength=n_groups) > 0
+        split = ViolinDataExtractor._split_by_codes(y_all, y_valid, codes, n_groups)
+        groups = [label for label, p in zip(labels, present) if p]
+        values = [v for v, p in zip(split, present) if p]
+        return groups, values
+
+    @staticmethod
+    def _split_by_codes(
+        y_all: np.ndarray, y_valid: np.ndarray, codes: np.ndarray, n_groups: int
+    ) -> List[np.ndarray]:
+        """
+        Split the valid entries of *y_all* into ``n_groups`` arrays by group code.
+
+        Rows keep their original order within each group.
+        """
+        if n_groups == 0:
+            return []
+        keep = (codes >= 0) & y_valid
+        kept_codes = codes[keep]
+        order = np.argsort(kept_codes, kind="stable")
+        bounds = np.searchsorted(kept_codes[order], np.arange(1, n_groups))
+        return np.split(y_all[keep][order], bounds)
+
 
 class ViolinBoxStatsCalculator:
     """
@@ -171,6 +318,9 @@ class ViolinBoxStatsCalculator:
     """
 
     TUKEY_FENCE_MULTIPLIER = 1.5
+    # Largest padded-cell / real-value ratio for which compute_batch packs
+    # groups into one array rather than computing them one by one.
+    BATCH_PADDING_LIMIT = 2.0
 
     @staticmethod
     def compute(values: np.ndarray) -> Dict[str, Any]:
@@ -179,38 +329,37 @@ class ViolinBoxStatsCalculator:
 
         Min/max are the extreme values *within* the Tukey fences.
         """
-        values = np.asarray(values)
-        values = values[~np.isnan(values)]
+        values = np.asarray(values, dtype=float)
 
-        if len(values) == 0:
+        if values.size == 0 or np.isnan(values).all():
             return ViolinBoxStatsCalculator._empty_stats()
 
-        sorted_vals = np.sort(values)
-        q1 = float(np.percentile(sorted_vals, 25))
-        q2 = float(np.percentile(sorted_vals, 50))
-        q3 = float(np.percentile(sorted_vals, 75))
+        # Quartiles are taken on the NaN-containing array so no filtered
+        # copy is materialised.
+        q1, q2, q3 = (float(q) for q in np.nanpercentile(values, (25, 50, 75)))
         iqr = q3 - q1
 
         lw = q1 - ViolinBoxStatsCalculator.TUKEY_FENCE_MULTIPLIER * iqr
         uw = q3 + ViolinBoxStatsCalculator.TUKEY_FENCE_MULTIPLIER * iqr
 
-        clipped = values[(values >= lw) & (values <= uw)]
-        if len(clipped) > 0:
-            min_val = float(clipped.min())
-            max_val = float(clipped.max())
+        # NaN fails both comparisons, so the fence mask also excludes it.
+        within = (values >= lw) & (values <= uw)
+        if within.any():
+            min_val = float(np.min(values, where=within, initial=np.inf))
+            max_val = float(np.max(values, where=within, initial=-np.inf))
         else:
-            min_val = float(values.min())
-            max_val = float(values.max())
+            min_val = float(np.nanmin(values))
+            max_val = float(np.nanmax(values))
 
         return {
-            MaidrKey.MIN.value: min_val,
-            MaidrKey.Q1.value: q1,
-            MaidrKey.Q2.value: q2,
-            MaidrKey.Q3.value: q3,
-            MaidrKey.MAX.value: max_val,
-            MaidrKey.MEAN.value: float(np.mean(sorted_vals)),
-            MaidrKey.LOWER_OUTLIER.value: [],
-            MaidrKey.UPPER_OUTLIER.value: [],
+            _K_MIN: min_val,
+            _K_Q1: q1,
+            _K_Q2: q2,
+            _K_Q3: q3,
+            _K_MAX: max_val,
+            _K_MEAN: float(np.nanmean(values)),
+            _K_LO: [],
+            _K_HI: [],
         }
 
     @staticmethod
@@ -219,34 +368,146 @@ class ViolinBoxStatsCalculator:
         Compute box stats using full data range for min/max (matplotlib convention).
         """
         values = np.asarray(values)
-        values = values[~np.isnan(values)]
+        sorted_vals = values[~np.isnan(values)]
 
-        if len(values) == 0:
+        if len(sorted_vals) == 0:
             return ViolinBoxStatsCalculator._empty_stats()
 
-        sorted_vals = np.sort(values)
+        # The NaN filter already produced a private copy, so sort it in place
+        # and read all three quartiles from a single percentile call.
+        sorted_vals.sort()
+        q1, q2, q3 = (float(q) for q in np.percentile(sorted_vals, (25, 50, 75)))
         return {
-            MaidrKey.MIN.value: float(sorted_vals[0]),
-            MaidrKey.Q1.value: float(np.percentile(sorted_vals, 25)),
-            MaidrKey.Q2.value: float(np.percentile(sorted_vals, 50)),
-            MaidrKey.Q3.value: float(np.percentile(sorted_vals, 75)),
-            MaidrKey.MAX.value: float(sorted_vals[-1]),
-            MaidrKey.MEAN.value: float(np.mean(sorted_vals)),
-            MaidrKey.LOWER_OUTLIER.value: [],
-            MaidrKey.UPPER_OUTLIER.value: [],
+            _K_MIN: float(sorted_vals[0]),
+            _K_Q1: q1,
+            _K_Q2: q2,
+            _K_Q3: q3,
+            _K_MAX: float(sorted_vals[-1]),
+            _K_MEAN: float(np.mean(sorted_vals)),
+            _K_LO: [],
+            _K_HI: [],
         }
 
+    @staticmethod
+    def compute_batch(
+        values_list: List[np.ndarray], full_range: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute box stats for many groups at once.
+
+        Groups are packed into one NaN-padded 2-D array and sorted once
+        row-wise, so quartiles (indexed at ``(n - 1) * q`` per row), whisker
+        extremes and means come from a handful of whole-array operations
+        instead of per-group NumPy dispatch. When group
+        sizes are too uneven for padding to pay off, falls back to
+        :meth:`compute` / :meth:`compute_full_range` per group.
+
+        Parameters
+        ----------
+        values_list : list[np.ndarray]
+            Raw values for each group. NaNs are ignored.
+        full_range : bool, default=False
+            Use the full data range for min/max (matplotlib convention)
+            instead of the Tukey-fence extremes (seaborn convention).
+
+        Returns
+        -------
+        list[dict]
+            One stats dict per group, as returned by :meth:`compute`.
+        """
+        arrays = [np.asarray(v, dtype=float).ravel() for v in values_list]
+        n_groups = len(arrays)
+        if n_groups == 0:
+            return []
+
+        lengths = np.fromiter((a.size for a in arrays), dtype=np.intp, count=n_groups)
+        width = int(lengths.max())
+        limit = ViolinBoxStatsCalculator.BATCH_PADDING_LIMIT
+        if width == 0 or width * n_groups > limit * lengths.sum():
+            single = (
+                ViolinBoxStatsCalculator.compute_full_range
+                if full_range
+                else ViolinBoxStatsCalculator.compute
+            )
+            return [single(values) for values in arrays]
+
+        rows = np.arange(n_groups)
+        padded = np.full((n_groups, width), np.nan)
+        for row, values in zip(padded, arrays):
+            row[: values.size] = values
+        # Sorting pushes both padding and missing values to the end of a row.
+        padded.sort(axis=1)
+        counts = np.count_nonzero(~np.isnan(padded), axis=1)
+        has_data = counts > 0
+        last = np.maximum(counts - 1, 0)
+
+        # Linear-interpolated quartiles read straight from the sorted rows at
+        # virtual index (n - 1) * q, using np.percentile's interpolation so
+        # the results match :meth:`compute`.
+        quartiles = []
+        for q in (0.25, 0.5, 0.75):
+            virtual = last * q
+            lo = np.floor(virtual).astype(np.intp)
+            hi = np.minimum(lo + 1, last)
+            gamma = virtual - lo
+            a, b = padded[rows, lo], padded[rows, hi]
+            diff = b - a
+            quartiles.append(
+                np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+            )
+        q1, q2, q3 = quartiles
+
+        data_min = padded[:, 0]
+        data_max = padded[rows, last]
+        if full_range:
+            min_vals, max_vals = data_min, data_max
+        else:
+            iqr = q3 - q1
+            lw = (q1 - ViolinBoxStatsCalculator.TUKEY_FENCE_MULTIPLIER * iqr)[:, None]
+            uw = (q3 + ViolinBoxStatsCalculator.TUKEY_FENCE_MULTIPLIER * iqr)[:, None]
+            within = (padded >= lw) & (padded <= uw)
+            any_within = within.any(axis=1)
+            min_vals = np.where(
+                any_within,
+                np.min(padded, axis=1, where=within, initial=np.inf),
+                data_min,
+            )
+            max_vals = np.where(
+                any_within,
+                np.max(padded, axis=1, where=within, initial=-np.inf),
+                data_max,
+            )
+
+        means = np.nansum(padded, axis=1) / np.maximum(counts, 1)
+
+        table = np.column_stack([min_vals, q1, q2, q3, max_vals, means]).tolist()
+        return [
+            {
+                _K_MIN: mn,
+                _K_Q1: v1,
+                _K_Q2: v2,
+                _K_Q3: v3,
+                _K_MAX: mx,
+                _K_MEAN: mean,
+                _K_LO: [],
+                _K_HI: [],
+            }
+            if ok
+            else ViolinBoxStatsCalculator._empty_stats()
+            for ok, (mn, v1, v2, v3, mx, mean) in zip(has_data.tolist(), table)
+        ]
+
     @staticmethod
     def _empty_stats() -> Dict[str, Any]:
         return {
-            MaidrKey.MIN.value: 0.0,
-            MaidrKey.Q1.value: 0.0,
-            MaidrKey.Q2.value: 0.0,
-            MaidrKey.Q3.value: 0.0,
-            MaidrKey.MAX.value: 0.0,
-            MaidrKey.MEAN.value: 0.0,
-            MaidrKey.LOWER_OUTLIER.value: [],
-            MaidrKey.UPPER_OUTLIER.value: [],
+            _K_MIN: 0.0,
+            _K_Q1: 0.0,
+            _K_Q2: 0.0,
+            _K_Q3: 0.0,
+            _K_MAX: 0.0,
+            _K_MEAN: 0.0,
+            _K_LO: [],
+            _K_HI: [],
         }
 
 
@@ -9,7 +9,6 @@ Registers two MAIDR layers per violin plot:
 
 from __future__ import annotations
 
-import uuid
 from typing import Any, Callable
 
 import numpy as np
@@ -22,8 +21,9 @@ from maidr.core.context_manager import ContextManager
 from maidr.core.enum import PlotType
 from maidr.core.enum.maidr_key import MaidrKey
 from maidr.core.figure_manager import FigureManager
-from maidr.core.plot.violinplot import ViolinDataExtractor
+from maidr.core.plot.violinplot import HORIZONTAL_ORIENTS, ViolinDataExtractor
 from maidr.util.mixin.extractor_mixin import LevelExtractorMixin
+from maidr.util.svg_utils import new_maidr_gids
 
 
 # ======================================================================
@@ -48,14 +48,12 @@ def patch_violinplot(
 
     plot_ax = kwargs.get("ax", ax) or ax
 
-    orient = kwargs.get("orient", "v")
-    orientation = "horz" if orient in ("h", "horizontal", "y") else "vert"
+    orientation = "horz" if kwargs.get("orient", "v") in HORIZONTAL_ORIENTS else "vert"
 
     inner = kwargs.get("inner", "box")
     if inner in ("box", "boxplot"):
         # Identify the Line2D objects seaborn added for the inner box.
         new_lines = [line for line in plot_ax.lines if id(line) not in lines_before]
-        sns_box_lines = _classify_sns_box_lines(new_lines, orientation)
 
         _register_box_layer(
             plot_ax,
@@ -64,7 +62,7 @@ def patch_violinplot(
             orientation,
             use_full_range=False,
             violin_options=None,
-            sns_box_lines=sns_box_lines,
+            sns_new_lines=new_lines,
         )
 
     _register_kde_layer(plot_ax, args, kwargs, orientation)
@@ -121,31 +119,37 @@ def _register_kde_layer(
     plot_ax: Axes, args: tuple, kwargs: dict, orientation: str
 ) -> None:
     """Detect PolyCollections on *plot_ax* and register a VIOLIN_KDE layer."""
-    kde_polys = [c for c in plot_ax.collections if isinstance(c, PolyCollection)]
-    if not kde_polys:
-        return
+    # Violins drawn by an earlier call on the same Axes already belong to a
+    # registered layer; only pick up the ones this call added.
+    registered: set[int] = getattr(plot_ax, "_maidr_violin_polys", set())
 
+    # Single pass over the collections: filter, fetch paths once and build
+    # the boundary line for each violin body.
+    kde_polys: list[PolyCollection] = []
     kde_lines: list[Line2D] = []
-    poly_gids: list[str] = []
-
-    for poly in kde_polys:
+    for poly in plot_ax.collections:
+        if not isinstance(poly, PolyCollection) or id(poly) in registered:
+            continue
         paths = poly.get_paths()
         if not paths:
             continue
-        boundary = np.asarray(paths[0].vertices)
+        boundary = paths[0].vertices
         line = Line2D(boundary[:, 0], boundary[:, 1])
         line.axes = plot_ax
 
-        gid = f"maidr-{uuid.uuid4()}"
-        line.set_gid(gid)
-        poly.set_gid(gid)
-
+        kde_polys.append(poly)
         kde_lines.append(line)
-        poly_gids.append(gid)
 
     if not kde_lines:
         return
 
+    poly_gids = new_maidr_gids(len(kde_lines))
+    for poly, line, gid in zip(kde_polys, kde_lines, poly_gids):
+        line.set_gid(gid)
+        poly.set_gid(gid)
+
+    setattr(plot_ax, "_maidr_violin_polys", registered | {id(p) for p in kde_polys})
+
     level_key = MaidrKey.Y if orientation == "horz" else MaidrKey.X
     x_levels = LevelExtractorMixin.extract_level(plot_ax, level_key)
 
@@ -169,13 +173,19 @@ def _register_box_layer(
     use_full_range: bool,
     violin_options: dict | None,
     mpl_artists: dict | None = None,
-    sns_box_lines: list[dict] | None = None,
+    sns_new_lines: list[Line2D] | None = None,
 ) -> None:
     """Extract raw data and register a VIOLIN_BOX layer."""
     groups, values = ViolinDataExtractor.extract(args, kwargs)
     if not groups or not values:
         return
 
+    sns_box_lines = None
+    if sns_new_lines is not None:
+        sns_box_lines = _classify_sns_box_lines(
+            sns_new_lines, orientation, single_violin=len(groups) == 1
+        )
+
     FigureManager.create_maidr(
         plot_ax,
         PlotType.VIOLIN_BOX,
@@ -192,7 +202,9 @@ def _register_box_layer(
 # ======================================================================
 # Seaborn inner-box line classification
 # ======================================================================
-def _classify_sns_box_lines(new_lines: list[Line2D], orientation: str) -> list[dict]:
+def _classify_sns_box_lines(
+    new_lines: list[Line2D], orientation: str, *, single_violin: bool = False
+) -> list[dict]:
     """
     Group and classify seaborn's inner-box Line2D objects.
 
@@ -203,22 +215,44 @@ def _classify_sns_box_lines(new_lines: list[Line2D], orientation: str) -> list[d
 
     Returns a list of dicts, one per violin, each with keys
     ``{"whisker": Line2D, "iq": Line2D, "median": Line2D}``.
+
+    When *single_violin* is set and there are no more lines than one inner
+    box draws, they all belong to that violin and position grouping is
+    skipped.
     """
     if not new_lines:
         return []
 
     is_vert = orientation == "vert"
 
-    # Group lines by their position (x for vertical, y for horizontal).
-    groups: dict[float, list[Line2D]] = {}
-    for line in new_lines:
-        pos_data = line.get_xdata() if is_vert else line.get_ydata()
-        pos = round(float(np.mean(pos_data)), 6)
-        groups.setdefault(pos, []).append(line)
+    # Per-line statistics in one vectorised pass: the value-axis spread
+    # (y for vert, x for horz) orders lines within a violin, and the mean
+    # position on the other axis says which violin a line belongs to.
+    if is_vert:
+        value_data = [line.get_ydata() for line in new_lines]
+        pos_data = [line.get_xdata() for line in new_lines]
+    else:
+        value_data = [line.get_xdata() for line in new_lines]
+        pos_data = [line.get_ydata() for line in new_lines]
+    lengths, value_min, value_max, _ = _segment_stats(value_data)
+    data_range = np.where(lengths >= 2, value_max - value_min, 0.0)
+
+    if single_violin and len(new_lines) <= 3:
+        group_of = np.zeros(len(new_lines), dtype=np.intp)
+        n_groups = 1
+    else:
+        _, _, _, pos_mean = _segment_stats(pos_data)
+        keys, group_of = np.unique(np.round(pos_mean, 6), return_inverse=True)
+        n_groups = len(keys)
+
+    # Sort by violin, then by spread; lexsort is stable, so ties keep
+    # their drawing order.
+    order = np.lexsort((data_range, group_of))
+    bounds = np.searchsorted(group_of[order], np.arange(1, n_groups))
 
     result: list[dict] = []
-    for pos in sorted(groups.keys()):
-        lines = groups[pos]
+    for members in np.split(order, bounds):
+        lines = [new_lines[i] for i in members]
         classified: dict[str, Line2D | None] = {
             "whisker": None,
             "iq": None,
@@ -226,26 +260,10 @@ def _classify_sns_box_lines(new_lines: list[Line2D], orientation: str) -> list[d
         }
 
         if len(lines) >= 3:
-            # Sort by data range on the value axis (y for vert, x for horz).
-            def _data_range(line: Line2D) -> float:
-                vals = line.get_ydata() if is_vert else line.get_xdata()
-                if len(vals) < 2:
-                    return 0.0
-                return float(np.ptp(vals))
-
-            lines.sort(key=_data_range)
             classified["median"] = lines[0]  # smallest range (single point)
             classified["iq"] = lines[1]  # medium range
             classified["whisker"] = lines[2]  # largest range
         elif len(lines) == 2:
-
-            def _data_range(line: Line2D) -> float:
-                vals = line.get_ydata() if is_vert else line.get_xdata()
-                if len(vals) < 2:
-                    return 0.0
-                return float(np.ptp(vals))
-
-            lines.sort(key=_data_range)
             classified["median"] = lines[0]
             classified["whisker"] = lines[1]
         elif len(lines) == 1:
@@ -254,3 +272,29 @@ def _classify_sns_box_lines(new_lines: list[Line2D], orientation: str) -> list[d
         result.append(classified)
 
     return result
+
+
+def _segment_stats(
+    arrays: list[Any],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return per-array ``(length, min, max, mean)`` for a list of 1-D arrays.
+
+    All arrays are concatenated once and reduced with ``ufunc.reduceat``.
+    Empty arrays get NaN for every statistic but their length.
+    """
+    n = len(arrays)
+    lengths = np.fromiter((len(a) for a in arrays), dtype=np.intp, count=n)
+    mins = np.full(n, np.nan)
+    maxs = np.full(n, np.nan)
+    means = np.full(n, np.nan)
+    filled = lengths > 0
+    if not filled.any():
+        return lengths, mins, maxs, means
+
+    flat = np.concatenate([np.asarray(a, dtype=float).ravel() for a in arrays])
+    starts = (np.cumsum(lengths) - lengths)[filled]
+    mins[filled] = np.minimum.reduceat(flat, starts)
+    maxs[filled] = np.maximum.reduceat(flat, starts)
+    means[filled] = np.add.reduceat(flat, starts) / lengths[filled]
+    return lengths, mins, maxs, means
@@ -124,20 +124,26 @@ class PlotlyBoxPlot(PlotlyPlot):
         lowerfence = self._trace.get("lowerfence", q1_vals)
         upperfence = self._trace.get("upperfence", q3_vals)
 
-        results = []
-        for i in range(len(median_vals)):
-            results.append(
-                {
-                    MaidrKey.LOWER_OUTLIER.value: [],
-                    MaidrKey.MIN.value: self._to_native(lowerfence[i]),
-                    MaidrKey.Q1.value: self._to_native(q1_vals[i]),
-                    MaidrKey.Q2.value: self._to_native(median_vals[i]),
-                    MaidrKey.Q3.value: self._to_native(q3_vals[i]),
-                    MaidrKey.MAX.value: self._to_native(upperfence[i]),
-                    MaidrKey.UPPER_OUTLIER.value: [],
-                }
+        # Convert each column once, then zip the aligned columns together.
+        to_list = self._to_native_list
+        return [
+            {
+                MaidrKey.LOWER_OUTLIER.value: [],
+                MaidrKey.MIN.value: lo,
+                MaidrKey.Q1.value: q1,
+                MaidrKey.Q2.value: q2,
+                MaidrKey.Q3.value: q3,
+                MaidrKey.MAX.value: hi,
+                MaidrKey.UPPER_OUTLIER.value: [],
+            }
+            for lo, q1, q2, q3, hi in zip(
+                to_list(lowerfence),
+                to_list(q1_vals),
+                to_list(median_vals),
+                to_list(q3_vals),
+                to_list(upperfence),
             )
-        return results
+        ]
 
     def _extract_from_raw_data(self) -> list[dict]:
         """Compute box plot statistics from raw data.
@@ -164,38 +170,60 @@ class PlotlyBoxPlot(PlotlyPlot):
 
     def _extract_grouped(self, x: list[Any], y: list[Any]) -> list[dict]:
         """Extract stats grouped by x categories."""
-        x = list(x)
-        y = list(y)
+        n = min(len(x), len(y))
+        x = list(x)[:n]
         # Preserve order of appearance
         categories = list(dict.fromkeys(x))
-        groups: dict[Any, list] = {cat: [] for cat in categories}
-        for xi, yi in zip(x, y):
-            groups[xi].append(yi)
-
-        results = []
-        for cat in categories:
-            arr = np.array(groups[cat], dtype=float)
-            results.append(self._compute_stats(arr, label=str(cat)))
-        return results
+        position = {cat: i for i, cat in enumerate(categories)}
+        codes = np.fromiter((position[xi] for xi in x), dtype=np.intp, count=n)
+
+        # Convert the values once and split them by category with a single
+        # stable sort instead of appending to per-category lists.
+        values = np.array(list(y)[:n], dtype=float)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(1, len(categories)))
+        groups = np.split(values[order], bounds)
+
+        return [
+            self._compute_stats(arr, label=str(cat))
+            for cat, arr in zip(categories, groups)
+        ]
 
     def _compute_stats(self, arr: np.ndarray, label: str = "") -> dict:
-        """Compute box plot statistics for a numeric array."""
-        q1 = float(np.percentile(arr, 25))
-        q2 = float(np.percentile(arr, 50))
-        q3 = float(np.percentile(arr, 75))
+        """Compute box plot statistics for a numeric array.
+
+        Missing values (``None``/NaN) are ignored, as Plotly does.
+        """
+        q1, q2, q3 = (float(q) for q in np.nanpercentile(arr, (25, 50, 75)))
         iqr = q3 - q1
         lower_fence = q1 - 1.5 * iqr
         upper_fence = q3 + 1.5 * iqr
 
+        # NaN fails every comparison, so these masks already exclude it and
+        # the reductions run over the original array without a copy.
+        above_lower = arr >= lower_fence
+        below_upper = arr <= upper_fence
         min_val = (
-            float(np.min(arr[arr >= lower_fence])) if np.any(arr >= lower_fence) else q1
+            float(np.min(arr, where=above_lower, initial=np.inf))
+            if above_lower.any()
+            else q1
         )
         max_val = (
-            float(np.max(arr[arr <= upper_fence])) if np.any(arr <= upper_fence) else q3
+            float(np.max(arr, where=below_upper, initial=-np.inf))
+            if below_upper.any()
+            else q3
         )
 
-        lower_outliers = sorted(float(v) for v in arr[arr < lower_fence])
-        upper_outliers = sorted(float(v) for v in arr[arr > upper_fence])
+        # Outliers are rare: only gather and sort them when a cheap any()
+        # says there are some, and let NumPy do the sort and conversion.
+        below = arr < lower_fence
+        above = arr > upper_fence
+        lower_outliers = (
+            np.sort(arr[below], kind="stable").tolist() if below.any() else []
+        )
+        upper_outliers = (
+            np.sort(arr[above], kind="stable").tolist() if above.any() else []
+        )
 
         result = {
             MaidrKey.LOWER_OUTLIER.value: lower_outliers,
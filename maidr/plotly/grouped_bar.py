@@ -38,22 +38,21 @@ class PlotlyGroupedBarPlot(PlotlyPlot):
         Each inner list represents one group (hue value).  Every item has
         ``x``, ``fill`` (group name), and ``y`` keys.
         """
-        data: list[list[dict]] = []
+        x_key = MaidrKey.X.value
+        y_key = MaidrKey.Y.value
+        fill_key = MaidrKey.Z.value
+        to_list = self._to_native_list
 
+        data: list[list[dict]] = []
         for trace in self._traces:
-            x_vals = trace.get("x", [])
-            y_vals = trace.get("y", [])
-            fill = trace.get("name", "")
-
-            group: list[dict] = []
-            for xv, yv in zip(x_vals, y_vals):
-                group.append(
-                    {
-                        MaidrKey.X.value: self._to_native(xv),
-                        MaidrKey.Z.value: str(fill),
-                        MaidrKey.Y.value: self._to_native(yv),
-                    }
-                )
-            data.append(group)
+            fill = str(trace.get("name", ""))
+            data.append(
+                [
+                    {x_key: xv, fill_key: fill, y_key: yv}
+                    for xv, yv in zip(
+                        to_list(trace.get("x", [])), to_list(trace.get("y", []))
+                    )
+                ]
+            )
 
         return data
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from maidr.core.enum.maidr_key import MaidrKey
 from maidr.core.enum.plot_type import PlotType
 from maidr.plotly.plotly_plot import PlotlyPlot
 
+# Exact types ``_to_native`` returns unchanged (ints become floats here).
+_PASSTHROUGH_SCALARS = frozenset({float, str})
+
 
 class PlotlyHeatmapPlot(PlotlyPlot):
     """Extract data from a Plotly heatmap trace."""
@@ -23,6 +28,9 @@ class PlotlyHeatmapPlot(PlotlyPlot):
         Extends the base implementation to also convert numeric strings
         and non-numpy numeric types to floats.
         """
+        # Floats and strings pass through unchanged; check them first.
+        if type(val) in _PASSTHROUGH_SCALARS:
+            return val
         if hasattr(val, "item"):
             return val.item()
         if isinstance(val, str):
@@ -37,17 +45,20 @@ class PlotlyHeatmapPlot(PlotlyPlot):
         x = self._trace.get("x", None)
         y = self._trace.get("y", None)
 
-        # Convert z matrix to list of lists of native floats
-        points = []
-        for row in z:
-            points.append([self._to_native(v) for v in row])
+        # Convert z matrix to list of lists of native floats. A numeric
+        # 2-D array converts in one call; anything else goes row by row.
+        to_list = self._to_native_list
+        if isinstance(z, np.ndarray) and z.ndim == 2 and z.dtype.kind != "O":
+            points = to_list(z)
+        else:
+            points = [to_list(row) for row in z]
 
         result: dict = {MaidrKey.POINTS: points}
 
         if x is not None:
-            result[MaidrKey.X] = [self._to_native(v) for v in x]
+            result[MaidrKey.X] = to_list(x)
         if y is not None:
-            result[MaidrKey.Y] = [self._to_native(v) for v in y]
+            result[MaidrKey.Y] = to_list(y)
 
         return result
 
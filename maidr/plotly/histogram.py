@@ -121,25 +121,20 @@ def _auto_shift_bins(
     data_max : float
         Maximum data value.
     """
-    edge_count = 0
-    mid_count = 0
-    int_count = 0
-
-    def near_edge(v: float) -> bool:
-        return (1 + (v - bin_start) * 100 / dtick) % 100 < 2
-
-    for v in data:
-        if v % 1 == 0:
-            int_count += 1
-        if near_edge(v):
-            edge_count += 1
-        if near_edge(v + dtick / 2):
-            mid_count += 1
-
     n = len(data)
     if n == 0:
         return bin_start
 
+    def near_edge(v: float | np.ndarray) -> bool | np.ndarray:
+        # np.remainder follows Python's float ``%``, so the scalar and
+        # array forms agree exactly.
+        return np.remainder(1 + (v - bin_start) * 100 / dtick, 100) < 2
+
+    # Count over the whole array at once instead of per value.
+    int_count = int(np.count_nonzero(np.remainder(data, 1) == 0))
+    edge_count = int(np.count_nonzero(near_edge(data)))
+    mid_count = int(np.count_nonzero(near_edge(data + dtick / 2)))
+
     # Case 1: All values are integers.
     if int_count == n:
         if dtick < 1:
@@ -191,21 +186,27 @@ class PlotlyHistogramPlot(PlotlyPlot):
         bin_edges = self._compute_bin_edges(arr)
         counts, bin_edges = np.histogram(arr, bins=bin_edges)
 
-        data = []
-        for i, count in enumerate(counts):
-            x_min = float(bin_edges[i])
-            x_max = float(bin_edges[i + 1])
-            data.append(
-                {
-                    MaidrKey.X.value: (x_min + x_max) / 2,
-                    MaidrKey.Y.value: int(count),
-                    MaidrKey.X_MIN.value: x_min,
-                    MaidrKey.X_MAX.value: x_max,
-                    MaidrKey.Y_MIN.value: 0,
-                    MaidrKey.Y_MAX.value: int(count),
-                }
+        # Derive every per-bin value with array arithmetic and convert each
+        # column to Python numbers in one tolist() call.
+        x_mins = bin_edges[:-1]
+        x_maxs = bin_edges[1:]
+        centers = (x_mins + x_maxs) / 2
+        return [
+            {
+                MaidrKey.X.value: center,
+                MaidrKey.Y.value: count,
+                MaidrKey.X_MIN.value: x_min,
+                MaidrKey.X_MAX.value: x_max,
+                MaidrKey.Y_MIN.value: 0,
+                MaidrKey.Y_MAX.value: count,
+            }
+            for center, count, x_min, x_max in zip(
+                centers.tolist(),
+                counts.astype(int).tolist(),
+                x_mins.tolist(),
+                x_maxs.tolist(),
             )
-        return data
+        ]
 
     def _extract_categorical_data(self, x: list) -> list[dict]:
         """Count occurrences of categorical values and return bar-format data.
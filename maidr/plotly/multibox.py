@@ -130,36 +130,45 @@ class PlotlyMultiBoxPlot(PlotlyPlot):
         self, x: list[Any], y: list[Any]
     ) -> list[dict]:
         """Extract stats grouped by x categories."""
-        x_list = list(x)
-        y_list = list(y)
-        categories = list(dict.fromkeys(x_list))
-        groups: dict[Any, list] = {cat: [] for cat in categories}
-        for xi, yi in zip(x_list, y_list):
-            groups[xi].append(yi)
-
-        results = []
-        for cat in categories:
-            arr = np.array(groups[cat], dtype=float)
-            results.append(self._compute_stats(arr, label=str(cat)))
-        return results
+        n = min(len(x), len(y))
+        x = list(x)[:n]
+        # Preserve order of appearance
+        categories = list(dict.fromkeys(x))
+        position = {cat: i for i, cat in enumerate(categories)}
+        codes = np.fromiter((position[xi] for xi in x), dtype=np.intp, count=n)
+
+        # Convert the values once and split them by category with a single
+        # stable sort instead of appending to per-category lists.
+        values = np.array(list(y)[:n], dtype=float)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(1, len(categories)))
+        groups = np.split(values[order], bounds)
+
+        return [
+            self._compute_stats(arr, label=str(cat))
+            for cat, arr in zip(categories, groups)
+        ]
 
     def _compute_stats(self, arr: np.ndarray, label: str = "") -> dict:
         """Compute box plot statistics for a numeric array."""
-        q1 = float(np.percentile(arr, 25))
-        q2 = float(np.percentile(arr, 50))
-        q3 = float(np.percentile(arr, 75))
+        # One call partitions the data once for all three quartiles.
+        q1, q2, q3 = (float(q) for q in np.percentile(arr, (25, 50, 75)))
         iqr = q3 - q1
         lower_fence = q1 - 1.5 * iqr
         upper_fence = q3 + 1.5 * iqr
 
+        # Build each fence mask once and reduce over it in place rather than
+        # materialising the filtered arrays.
+        above_lower = arr >= lower_fence
+        below_upper = arr <= upper_fence
         min_val = (
-            float(np.min(arr[arr >= lower_fence]))
-            if np.any(arr >= lower_fence)
+            float(np.min(arr, where=above_lower, initial=np.inf))
+            if above_lower.any()
             else q1
         )
         max_val = (
-            float(np.max(arr[arr <= upper_fence]))
-            if np.any(arr <= upper_fence)
+            float(np.max(arr, where=below_upper, initial=-np.inf))
+            if below_upper.any()
             else q3
         )
 
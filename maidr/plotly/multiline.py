@@ -44,15 +44,18 @@ class PlotlyMultiLinePlot(PlotlyPlot):
             y = trace.get("y", [])
             name = trace.get("name", "")
 
-            line_data: list[dict] = []
-            for xv, yv in zip(x, y):
-                point: dict = {
-                    MaidrKey.X: self._to_native(xv),
-                    MaidrKey.Y: self._to_native(yv),
-                }
-                if name:
-                    point[MaidrKey.Z] = name
-                line_data.append(point)
+            # Convert each coordinate array once, then pair them up.
+            xs = self._to_native_list(x)
+            ys = self._to_native_list(y)
+            if name:
+                line_data = [
+                    {MaidrKey.X: xv, MaidrKey.Y: yv, MaidrKey.Z: name}
+                    for xv, yv in zip(xs, ys)
+                ]
+            else:
+                line_data = [
+                    {MaidrKey.X: xv, MaidrKey.Y: yv} for xv, yv in zip(xs, ys)
+                ]
 
             if line_data:
                 all_lines.append(line_data)
@@ -445,8 +445,11 @@ class PlotlyMaidr:
             notebook/Shiny srcdoc iframe.  Switches the loader to use
             the parent-window source strings instead of relative paths.
         """
+        # Compact separators keep the schema on the C-accelerated encoder
+        # (``indent`` forces the pure-Python one) and shrink the payload.
+        schema_json = json.dumps(schema, separators=(",", ":"))
         dom_wiring = f"""
-            var maidrSchema = {json.dumps(schema, indent=2)};
+            var maidrSchema = {schema_json};
 
             var _maidrDone = false;
             function initMaidr() {{
@@ -5,9 +5,14 @@ import uuid
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+
 from maidr.core.enum.maidr_key import MaidrKey
 from maidr.core.enum.plot_type import PlotType
 
+# Exact types that are already JSON-native and need no conversion.
+_NATIVE_SCALARS = frozenset({int, float, str})
+
 
 class PlotlyPlot(ABC):
     """
@@ -56,10 +61,33 @@ class PlotlyPlot(ABC):
             A native Python type if the input was a numpy scalar,
             otherwise the original value.
         """
+        # Plain Python scalars are the common case; skip the attribute probe.
+        if type(val) in _NATIVE_SCALARS:
+            return val
         if hasattr(val, "item"):
             return val.item()
         return val
 
+    @classmethod
+    def _to_native_list(cls, values: Any) -> list:
+        """Convert a sequence of values to a list of native Python types.
+
+        Parameters
+        ----------
+        values : Any
+            A numpy array or any other iterable of values.
+
+        Returns
+        -------
+        list
+            The values as native Python types. Numeric numpy arrays are
+            converted in a single ``tolist()`` call (nested for 2-D input)
+            instead of element by element.
+        """
+        if isinstance(values, np.ndarray) and values.dtype.kind != "O":
+            return values.tolist()
+        return [cls._to_native(v) for v in values]
+
     def render(self) -> dict:
         """Generate the MAIDR schema for this plot layer."""
         data = self._extract_plot_data()
@@ -1,3 +1,6 @@
+import os
+import uuid
+
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
@@ -39,8 +42,28 @@ def unique_lines_by_xy(lines: List[Line2D]) -> List[Line2D]:
         xy = np.asarray(line.get_xydata())
         if xy.shape[0] == 0:
             continue
-        xy_rounded = tuple(map(tuple, np.round(xy, 8)))
-        if xy_rounded not in seen_xy:
-            seen_xy.add(xy_rounded)
+        # Adding 0.0 folds -0.0 into 0.0 so equal values hash equal bytes.
+        xy_rounded = np.round(xy, 8) + 0.0
+        if np.isnan(xy_rounded).any():
+            # NaN never compares equal, so such lines are always kept.
+            unique_lines.append(line)
+            continue
+        key = (xy_rounded.shape, xy_rounded.tobytes())
+        if key not in seen_xy:
+            seen_xy.add(key)
             unique_lines.append(line)
     return unique_lines
+
+
+def new_maidr_gids(count: int) -> List[str]:
+    """
+    Return *count* fresh ``maidr-<uuid4>`` element ids.
+
+    The random bytes for all ids are drawn in a single ``os.urandom`` call
+    rather than one call per id.
+    """
+    raw = os.urandom(16 * count)
+    return [
+        f"maidr-{uuid.UUID(bytes=raw[i : i + 16], version=4)}"
+        for i in range(0, 16 * count, 16)
+    ]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+
+from maidr.core.plot.candlestick import CandlestickPlot
+
+
+def _ohlc(**overrides) -> pd.DataFrame:
+    data = {
+        "Open": [1.0, 2.0, 3.0],
+        "High": [2.0, 3.0, 4.0],
+        "Low": [0.5, 1.5, 2.5],
+        "Close": [1.5, 2.5, np.nan],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data, index=pd.date_range("2024-01-01", periods=3))
+
+
+class TestCandlestickPlot:
+    def test_extract_from_dataframe_matches_row_extraction(self):
+        fig, ax = plt.subplots()
+        plot = CandlestickPlot([ax])
+        plt.close(fig)
+
+        for df in (_ohlc(), _ohlc(Volume=[10, 20, 30])):
+            candles = plot._extract_from_dataframe(df)
+            expected = CandlestickPlot._extract_rows(df)
+            # assert_equal treats NaN as equal to NaN, unlike ``==`` on dicts.
+            np.testing.assert_equal(candles, expected)
+            assert [{k: type(v) for k, v in c.items()} for c in candles] == [
+                {k: type(v) for k, v in c.items()} for c in expected
+            ]
+
+        candles = plot._extract_from_dataframe(_ohlc())
+        assert candles[0]["value"] == "2024-01-01 00:00:00"
+        assert candles[1]["volume"] == 0.0
+
+    def test_extract_from_dataframe_skips_malformed_rows(self):
+        fig, ax = plt.subplots()
+        plot = CandlestickPlot([ax])
+        plt.close(fig)
+
+        candles = plot._extract_from_dataframe(_ohlc(Open=[1.0, "bad", 3.0]))
+
+        assert [c["open"] for c in candles] == [1.0, 3.0]
+
+    def test_extract_from_dataframe_skips_nullable_na_rows(self):
+        fig, ax = plt.subplots()
+        plot = CandlestickPlot([ax])
+        plt.close(fig)
+
+        df = _ohlc(
+            Close=pd.array([1.5, None, 3.5], dtype="Float64"),
+            Volume=pd.array([10, 20, None], dtype="Int64"),
+        )
+        candles = plot._extract_from_dataframe(df)
+
+        assert [c["close"] for c in candles] == [1.5]
+        assert candles[0]["volume"] == 10.0
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from maidr.core.plot.violin_box_plot import ViolinBoxPlot
+
+
+class TestViolinBoxPlot:
+    def test_stats_round_half_way_values_like_python_round(self):
+        fig, ax = plt.subplots()
+        plot = ViolinBoxPlot(
+            ax,
+            groups=["a"],
+            values=[np.array([7.23925])],
+            violin_options={"showMean": True},
+        )
+        plt.close(fig)
+
+        (record,) = plot._extract_plot_data()
+
+        # np.round would give 7.2392 here.
+        for key in ("min", "q1", "q2", "q3", "max", "mean"):
+            assert record[key] == round(7.23925, 4) == 7.2393
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from maidr.core.enum.maidr_key import MaidrKey
+from maidr.core.plot.violinplot import ViolinBoxStatsCalculator, ViolinDataExtractor
+
+
+class TestViolinDataExtractor:
+    def test_extract_groups_sorted_and_nan_dropped(self):
+        df = pd.DataFrame({"g": ["B", "A", "B", "A"], "v": [1.0, 2.0, np.nan, 4.0]})
+        groups, values = ViolinDataExtractor.extract(
+            (), {"data": df, "x": "g", "y": "v"}
+        )
+
+        assert groups == ["A", "B"]
+        assert values[0].tolist() == [2.0, 4.0]
+        assert values[1].tolist() == [1.0]
+
+    def test_extract_categorical_keeps_empty_categories(self):
+        df = pd.DataFrame(
+            {
+                "g": pd.Categorical(["a", "a"], categories=["b", "a"]),
+                "v": [1.0, 2.0],
+            }
+        )
+        groups, values = ViolinDataExtractor.extract(
+            (), {"data": df, "x": "g", "y": "v"}
+        )
+
+        assert groups == ["b", "a"]
+        assert values[0].tolist() == []
+        assert values[1].tolist() == [1.0, 2.0]
+
+    def test_extract_hue_uses_observed_combinations(self):
+        df = pd.DataFrame(
+            {
+                "g": ["A", "A", "B"],
+                "h": ["x", "y", "x"],
+                "v": [1.0, 2.0, 3.0],
+            }
+        )
+        groups, values = ViolinDataExtractor.extract(
+            (), {"data": df, "x": "g", "y": "v", "hue": "h"}
+        )
+
+        assert groups == ["A_x", "A_y", "B_x"]
+        assert [v.tolist() for v in values] == [[1.0], [2.0], [3.0]]
+
+    def test_extract_respects_order(self):
+        df = pd.DataFrame({"g": ["A", "B"], "v": [1.0, 2.0]})
+        groups, _ = ViolinDataExtractor.extract(
+            (), {"data": df, "x": "g", "y": "v", "order": ["B", "C", "A"]}
+        )
+
+        assert groups == ["B", "A"]
+
+    def test_extract_respects_hue_order(self):
+        df = pd.DataFrame(
+            {
+                "g": ["A", "A", "B", None],
+                "h": ["x", "y", "y", "x"],
+                "v": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        groups, values = ViolinDataExtractor.extract(
+            (), {"data": df, "x": "g", "y": "v", "hue": "h", "hue_order": ["y", "x"]}
+        )
+
+        assert groups == ["A_y", "A_x", "B_y"]
+        assert [v.tolist() for v in values] == [[2.0], [1.0], [3.0]]
+
+    def test_extract_nested_lists(self):
+        groups, values = ViolinDataExtractor.extract(([[1, 2], [3, 4, 5]],), {})
+
+        assert groups == ["Group 1", "Group 2"]
+        assert values[1].tolist() == [3, 4, 5]
+
+
+class TestViolinBoxStatsCalculator:
+    def test_compute_ignores_nan(self):
+        values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, np.nan])
+        stats = ViolinBoxStatsCalculator.compute(values)
+
+        assert stats[MaidrKey.Q1.value] == 3.0
+        assert stats[MaidrKey.Q2.value] == 5.0
+        assert stats[MaidrKey.Q3.value] == 7.0
+        assert stats[MaidrKey.MIN.value] == 1.0
+        assert stats[MaidrKey.MAX.value] == 9.0
+        assert stats[MaidrKey.MEAN.value] == 5.0
+
+    def test_compute_clips_to_tukey_fences(self):
+        values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100])
+        stats = ViolinBoxStatsCalculator.compute(values)
+
+        assert stats[MaidrKey.MIN.value] == 1.0
+        assert stats[MaidrKey.MAX.value] == 9.0
+
+    def test_compute_all_nan_returns_empty_stats(self):
+        stats = ViolinBoxStatsCalculator.compute(np.array([np.nan, np.nan]))
+
+        assert stats[MaidrKey.Q2.value] == 0.0
+        assert stats[MaidrKey.LOWER_OUTLIER.value] == []
+
+    def test_compute_full_range_uses_data_extremes(self):
+        values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100])
+        stats = ViolinBoxStatsCalculator.compute_full_range(values)
+
+        assert stats[MaidrKey.MIN.value] == 1.0
+        assert stats[MaidrKey.MAX.value] == 100.0
+
+    def test_compute_batch_matches_per_group(self):
+        rng = np.random.default_rng(0)
+        groups = [rng.normal(size=n) for n in (20, 25, 30)]
+        groups[1][[3, 7]] = np.nan
+        groups[2][0] = 50.0
+
+        for full_range in (False, True):
+            single = (
+                ViolinBoxStatsCalculator.compute_full_range
+                if full_range
+                else ViolinBoxStatsCalculator.compute
+            )
+            batch = ViolinBoxStatsCalculator.compute_batch(groups, full_range)
+            for got, values in zip(batch, groups):
+                expected = single(values)
+                for key in ("min", "q1", "q2", "q3", "max"):
+                    assert got[key] == expected[key]
+                assert np.isclose(got["mean"], expected["mean"])
+
+    def test_compute_batch_ragged_groups_with_nans_match_per_group(self):
+        rng = np.random.default_rng(1)
+        groups = [rng.normal(size=n) for n in (150, 90, 121, 1, 140, 7)]
+        for values in groups[:3]:
+            values[rng.choice(values.size, size=7, replace=False)] = np.nan
+        groups[5][[0, 4]] = np.nan
+
+        for full_range in (False, True):
+            single = (
+                ViolinBoxStatsCalculator.compute_full_range
+                if full_range
+                else ViolinBoxStatsCalculator.compute
+            )
+            batch = ViolinBoxStatsCalculator.compute_batch(groups, full_range)
+
+            assert len(batch) == len(groups)
+            for got, values in zip(batch, groups):
+                expected = single(values)
+                for key in ("min", "q1", "q2", "q3", "max"):
+                    assert got[key] == expected[key]
+                assert np.isclose(got["mean"], expected["mean"])
+
+    def test_compute_batch_handles_empty_groups(self):
+        batch = ViolinBoxStatsCalculator.compute_batch(
+            [np.array([1.0, 2.0, 3.0]), np.array([np.nan, np.nan, np.nan])]
+        )
+
+        assert batch[0][MaidrKey.Q2.value] == 2.0
+        assert batch[1][MaidrKey.Q2.value] == 0.0
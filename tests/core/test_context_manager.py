@@ -0,0 +1,21 @@
+from maidr.core.context_manager import HighlightContextManager
+
+
+class TestHighlightContextManager:
+    def test_set_maidr_element_maps_to_selector_id(self):
+        first, second = object(), object()
+
+        with HighlightContextManager.set_maidr_elements(
+            [first, second, first], ["s1", "s2", "s3"]
+        ):
+            with HighlightContextManager.set_maidr_element(second, "maidr-a"):
+                assert HighlightContextManager.get_selector_id("maidr-a") == "s2"
+            with HighlightContextManager.set_maidr_element(first, "maidr-b"):
+                assert HighlightContextManager.get_selector_id("maidr-b") == "s1"
+
+        assert not HighlightContextManager.is_maidr_element("maidr-a")
+
+    def test_set_maidr_element_ignores_untracked_artist(self):
+        with HighlightContextManager.set_maidr_elements([object()], ["s1"]):
+            with HighlightContextManager.set_maidr_element(object(), "maidr-c"):
+                assert not HighlightContextManager.is_maidr_element("maidr-c")
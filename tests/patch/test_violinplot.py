@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from maidr.patch.violinplot import _classify_sns_box_lines, _segment_stats
+
+
+def _box_lines(pos: float, vert: bool = True) -> dict[str, Line2D]:
+    """Build seaborn-style inner-box lines for one violin at *pos*."""
+    spans = {"whisker": (0.0, 10.0), "iq": (3.0, 7.0), "median": (5.0,)}
+    lines = {}
+    for role, values in spans.items():
+        positions = [pos] * len(values)
+        xy = (positions, values) if vert else (values, positions)
+        lines[role] = Line2D(*xy)
+    return lines
+
+
+class TestClassifySnsBoxLines:
+    def test_vertical_lines_grouped_by_position_and_classified(self):
+        first, second = _box_lines(0.0), _box_lines(1.0)
+        drawn = [
+            second["median"],
+            first["whisker"],
+            second["iq"],
+            first["median"],
+            second["whisker"],
+            first["iq"],
+        ]
+
+        result = _classify_sns_box_lines(drawn, "vert")
+
+        assert result == [first, second]
+
+    def test_horizontal_lines_use_y_for_position(self):
+        first, second = _box_lines(0.0, vert=False), _box_lines(1.0, vert=False)
+        drawn = [*second.values(), *first.values()]
+
+        result = _classify_sns_box_lines(drawn, "horz")
+
+        assert result == [first, second]
+
+    def test_partial_groups(self):
+        lines = _box_lines(0.0)
+        whisker_only = _box_lines(1.0)["whisker"]
+
+        result = _classify_sns_box_lines(
+            [lines["whisker"], lines["median"], whisker_only], "vert"
+        )
+
+        assert result == [
+            {"whisker": lines["whisker"], "iq": None, "median": lines["median"]},
+            {"whisker": whisker_only, "iq": None, "median": None},
+        ]
+
+    def test_single_violin_ignores_position_jitter(self):
+        lines = _box_lines(0.0)
+        lines["median"].set_xdata([1e-3])
+
+        grouped = _classify_sns_box_lines(list(lines.values()), "vert")
+        single = _classify_sns_box_lines(
+            list(lines.values()), "vert", single_violin=True
+        )
+
+        assert len(grouped) == 2
+        assert single == [lines]
+
+    def test_line_without_data_sorts_as_zero_range(self):
+        lines = _box_lines(0.0)
+        empty = Line2D([], [])
+
+        result = _classify_sns_box_lines([empty, lines["whisker"]], "vert")
+
+        assert result == [
+            {"whisker": lines["whisker"], "iq": None, "median": None},
+            {"whisker": empty, "iq": None, "median": None},
+        ]
+
+    def test_no_lines(self):
+        assert _classify_sns_box_lines([], "vert") == []
+
+
+class TestSegmentStats:
+    def test_empty_segments_get_nan(self):
+        lengths, mins, maxs, means = _segment_stats([[], [1.0, 3.0], [], [], [4.0], []])
+
+        assert lengths.tolist() == [0, 2, 0, 0, 1, 0]
+        np.testing.assert_equal(mins, [np.nan, 1.0, np.nan, np.nan, 4.0, np.nan])
+        np.testing.assert_equal(maxs, [np.nan, 3.0, np.nan, np.nan, 4.0, np.nan])
+        np.testing.assert_equal(means, [np.nan, 2.0, np.nan, np.nan, 4.0, np.nan])
+
+    def test_all_segments_empty(self):
+        lengths, mins, _, _ = _segment_stats([[], []])
+
+        assert lengths.tolist() == [0, 0]
+        assert np.isnan(mins).all()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+
 import numpy as np
 
 from maidr.core.enum.maidr_key import MaidrKey
@@ -151,6 +153,51 @@ class TestPlotlyLinePlot:
 
         assert MaidrKey.Z not in data[0][0]
 
+    def test_nan_and_none_gaps_are_kept(self):
+        trace = {
+            "type": "scatter",
+            "mode": "lines",
+            "x": np.array([1.0, 2.0, 3.0]),
+            "y": [1.0, None, np.nan],
+        }
+        plot = PlotlyLinePlot(trace, {})
+        (points,) = plot._extract_plot_data()
+
+        assert [p[MaidrKey.X] for p in points] == [1.0, 2.0, 3.0]
+        assert points[0][MaidrKey.Y] == 1.0
+        assert points[1][MaidrKey.Y] is None
+        assert np.isnan(points[2][MaidrKey.Y])
+
+    def test_datetime_x_values(self):
+        x = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]")
+        trace = {"type": "scatter", "mode": "lines", "x": x, "y": [1, 2]}
+        plot = PlotlyLinePlot(trace, {})
+        (points,) = plot._extract_plot_data()
+
+        assert [p[MaidrKey.X] for p in points] == [v.item() for v in x]
+        assert [p[MaidrKey.X] for p in points] == [
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+        ]
+
+    def test_mismatched_lengths_truncate_to_shorter(self):
+        trace = {
+            "type": "scatter",
+            "mode": "lines",
+            "x": np.arange(5),
+            "y": np.array([10, 20, 30]),
+            "name": "S",
+        }
+        plot = PlotlyLinePlot(trace, {})
+        (points,) = plot._extract_plot_data()
+
+        assert points == [
+            {MaidrKey.X: 0, MaidrKey.Y: 10, MaidrKey.Z: "S"},
+            {MaidrKey.X: 1, MaidrKey.Y: 20, MaidrKey.Z: "S"},
+            {MaidrKey.X: 2, MaidrKey.Y: 30, MaidrKey.Z: "S"},
+        ]
+        assert all(type(p[MaidrKey.X]) is int for p in points)
+
 
 class TestPlotlyBoxPlot:
     def test_extract_from_raw_data(self):
@@ -186,6 +233,31 @@ class TestPlotlyBoxPlot:
         assert data[0]["q2"] == 50
         assert data[0]["max"] == 95
 
+    def test_extract_precomputed_numpy_arrays(self):
+        trace = {
+            "type": "box",
+            "q1": np.array([25, 30]),
+            "median": np.array([50, 55]),
+            "q3": np.array([75, 80]),
+        }
+        plot = PlotlyBoxPlot(trace, {})
+        data = plot._extract_plot_data()
+
+        assert [d["q2"] for d in data] == [50, 55]
+        assert isinstance(data[1]["min"], int)
+        assert data[1]["max"] == 80
+
+    def test_extract_from_raw_data_ignores_missing(self):
+        trace = {"type": "box", "y": [1.0, None, 2.0, 3.0, float("nan"), 4.0, 5.0]}
+        plot = PlotlyBoxPlot(trace, {})
+        box = plot._extract_plot_data()[0]
+
+        assert box["q1"] == 2.0
+        assert box["q2"] == 3.0
+        assert box["q3"] == 4.0
+        assert box["min"] == 1.0
+        assert box["max"] == 5.0
+
     def test_grouped_box(self):
         trace = {
             "type": "box",
@@ -216,6 +288,21 @@ class TestPlotlyHeatmapPlot:
         assert data[MaidrKey.X] == ["a", "b", "c"]
         assert data[MaidrKey.Y] == ["r1", "r2"]
 
+    def test_extract_numpy_arrays(self):
+        trace = {
+            "type": "heatmap",
+            "z": np.array([[1.5, np.nan], [3.0, 4.0]]),
+            "x": np.array(["a", "b"]),
+            "y": np.array([10, 20]),
+        }
+        plot = PlotlyHeatmapPlot(trace, {})
+        data = plot._extract_plot_data()
+
+        assert data[MaidrKey.POINTS][0][0] == 1.5
+        assert np.isnan(data[MaidrKey.POINTS][0][1])
+        assert data[MaidrKey.X] == ["a", "b"]
+        assert all(isinstance(v, int) for v in data[MaidrKey.Y])
+
     def test_no_labels(self):
         trace = {"type": "heatmap", "z": [[1, 2], [3, 4]]}
         plot = PlotlyHeatmapPlot(trace, {})
@@ -279,6 +366,42 @@ class TestPlotlyHistogramPlot:
 
         assert len(data) == 5
 
+    def test_explicit_xbins(self):
+        trace = {
+            "type": "histogram",
+            "x": [1, 2, 2, 3, 3, 3],
+            "xbins": {"start": 0.5, "end": 3.5, "size": 1},
+        }
+        plot = PlotlyHistogramPlot(trace, {})
+        data = plot._extract_plot_data()
+
+        assert [d["y"] for d in data] == [1, 2, 3]
+        assert [d["xMin"] for d in data] == [0.5, 1.5, 2.5]
+        assert data[-1]["xMax"] == 3.5
+
+    def test_explicit_xbins_float_boundaries(self):
+        # np.arange edges (0.2, 0.4, 0.6000000000000001) place each value
+        # in its own bin; linspace edges would not.
+        trace = {
+            "type": "histogram",
+            "x": [0.0, 0.2, 0.2, 0.4, 0.4, 0.4],
+            "xbins": {"size": 0.2},
+        }
+        plot = PlotlyHistogramPlot(trace, {})
+        data = plot._extract_plot_data()
+
+        assert [d["y"] for d in data] == [1, 2, 3]
+
+    def test_explicit_xbins_empty_range(self):
+        trace = {
+            "type": "histogram",
+            "x": [1.0, 2.0],
+            "xbins": {"size": 1, "start": 3, "end": 2},
+        }
+        plot = PlotlyHistogramPlot(trace, {})
+
+        assert plot._extract_plot_data() == []
+
 
 class TestPlotlyGroupedBarPlot:
     def test_dodged_bar_data(self):
@@ -315,6 +438,30 @@ class TestPlotlyGroupedBarPlot:
         plot = PlotlyGroupedBarPlot(traces, {}, PlotType.DODGED)
         assert plot.schema[MaidrKey.TYPE] == PlotType.DODGED
 
+    def test_numpy_columns_gaps_and_mismatched_lengths(self):
+        traces = [
+            {
+                "type": "bar",
+                "x": np.array(["A", "B", "C"]),
+                "y": np.array([1.5, np.nan, 3.0]),
+                "name": "G1",
+            },
+            {"type": "bar", "x": ["A", "B", "C"], "y": [np.int64(4), None]},
+        ]
+        plot = PlotlyGroupedBarPlot(traces, {}, PlotType.DODGED)
+        data = plot._extract_plot_data()
+
+        first, second = data
+        assert [d["x"] for d in first] == ["A", "B", "C"]
+        assert all(type(d["x"]) is str for d in first)
+        assert first[0] == {"x": "A", "z": "G1", "y": 1.5}
+        assert np.isnan(first[1]["y"])
+        assert second == [
+            {"x": "A", "z": "", "y": 4},
+            {"x": "B", "z": "", "y": None},
+        ]
+        assert type(second[0]["y"]) is int
+
 
 
 
@@ -343,3 +490,29 @@ class TestPlotlyMultiLinePlot:
 
         assert schema[MaidrKey.TYPE] == PlotType.LINE
         assert len(schema[MaidrKey.DATA]) == 2
+
+    def test_gaps_datetimes_and_mismatched_lengths(self):
+        x = np.array(["2024-01-01", "2024-01-02", "2024-01-03"], dtype="datetime64[D]")
+        traces = [
+            {"type": "scatter", "mode": "lines", "x": x, "y": [1.0, None, np.nan]},
+            {"type": "scatter", "mode": "lines", "x": x, "y": [5], "name": "B"},
+            {"type": "scatter", "mode": "lines", "x": x, "y": []},
+        ]
+        plot = PlotlyMultiLinePlot(traces, {})
+        data = plot._extract_plot_data()
+
+        # The empty trace contributes no line.
+        assert len(data) == 2
+        first, second = data
+        assert [p[MaidrKey.X] for p in first] == [v.item() for v in x]
+        assert first[0][MaidrKey.Y] == 1.0
+        assert first[1][MaidrKey.Y] is None
+        assert np.isnan(first[2][MaidrKey.Y])
+        assert MaidrKey.Z not in first[0]
+        assert second == [
+            {
+                MaidrKey.X: datetime.date(2024, 1, 1),
+                MaidrKey.Y: 5,
+                MaidrKey.Z: "B",
+            }
+        ]
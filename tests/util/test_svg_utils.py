@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from maidr.util.svg_utils import unique_lines_by_xy
+
+
+class TestUniqueLinesByXy:
+    def test_drops_duplicates_within_rounding(self):
+        first = Line2D([0.0, 1.0], [2.0, 3.0])
+        close = Line2D([0.0, 1.0 + 1e-10], [2.0, 3.0])
+        other = Line2D([0.0, 1.0], [2.0, 4.0])
+
+        assert unique_lines_by_xy([first, close, other]) == [first, other]
+
+    def test_negative_zero_matches_zero(self):
+        positive = Line2D([0.0, 1.0], [0.0, 1.0])
+        negative = Line2D([-0.0, 1.0], [-0.0, 1.0])
+        tiny = Line2D([-1e-12, 1.0], [0.0, 1.0])
+
+        assert unique_lines_by_xy([positive, negative, tiny]) == [positive]
+
+    def test_lines_with_nan_are_always_kept(self):
+        first = Line2D([0.0, np.nan], [1.0, 2.0])
+        second = Line2D([0.0, np.nan], [1.0, 2.0])
+
+        assert unique_lines_by_xy([first, second]) == [first, second]
+
+    def test_same_values_different_shape_are_distinct(self):
+        first = Line2D([0.0, 1.0], [0.0, 1.0])
+        second = Line2D([0.0, 1.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0])
+
+        assert unique_lines_by_xy([first, second]) == [first, second]
+
+    def test_empty_lines_are_skipped(self):
+        line = Line2D([0.0], [1.0])
+
+        assert unique_lines_by_xy([Line2D([], []), line]) == [line]